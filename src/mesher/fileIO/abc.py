@@ -19,6 +19,15 @@ class IReader(metaclass=abc.ABCMeta):
 
         ...
 
+    @staticmethod
+    @abc.abstractmethod
+    def read_many(
+        filenames: list[str | pathlib.Path],
+    ) -> dict[str, dict[str | None, IRing]]:
+        """Read several geometry files concurrently."""
+
+        ...
+
 
 class IWriter(metaclass=abc.ABCMeta):
 
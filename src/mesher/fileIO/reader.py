@@ -1,6 +1,16 @@
+import concurrent.futures
+import io
+import mmap
 import os
 import pathlib
 
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None  # type: ignore[assignment]
+
 from mesher.geometry.point import Point
 from mesher.geometry.ring import Ring
 
@@ -19,9 +29,20 @@ class Reader(IReader):
     """
 
     @staticmethod
-    def read(filename: str | pathlib.Path) -> dict[str | None, Ring]:
+    def read(
+        filename: str | pathlib.Path, *, parallel: bool = False
+    ) -> dict[str | None, Ring]:
         """
-        Read point data from file and load it into figures.
+        Read point data from file and load it into figures. The file is memory-mapped
+        and scanned at the byte level: ring-name lines (no comma) are decoded as they
+        are found, while each contiguous block of numeric lines is parsed in one shot
+        straight out of the mapping without materializing per-line strings.
+
+        With `parallel=True` the numeric blocks are parsed by a process pool instead:
+        the first pass only records each ring's byte range, the workers re-map the
+        file themselves (no pickling of the data), and the parsed arrays are merged
+        back in order. Worth it for files with many large rings; the default stays
+        serial since the pool has real startup cost.
 
         TODO: update this when polygons/cells are implemented.
         TODO: handle filepaths more gracefully...
@@ -30,32 +51,404 @@ class Reader(IReader):
             filename:
                 File to read geometric data from (assumed not to include the full path,
                 we will let this do the work for now).
+            parallel:
+                Whether to parse ring blocks across a process pool.
 
         Returns:
             data:
                 Geometric data from file.
         """
 
-        if isinstance(filename, str):
-            filename = pathlib.Path(filename)
-
         filepath: pathlib.Path = CWD / filename
         if not os.path.exists(filepath):
             raise OSError(f"{filepath} doesn't exist!")
 
-        with open(filepath, "r") as f:
-            data: dict[str | None, Ring] = {}
-            current_name: str | None = None
-            for line in f.readlines():
-                content: list[str] = line.rstrip().split(",")
-                if len(content) == 1:
-                    data[content[0]] = Ring()
-                    current_name = content[0]
-
-                else:
-                    x: float = float(content[0])
-                    y: float = float(content[1])
-                    ID: int = int(content[2])
-                    data[current_name].add_point(Point(x=x, y=y, ID=ID))
+        data: dict[str | None, Ring] = {}
+        if os.path.getsize(filepath) == 0:
+            return data
+
+        blocks: list[tuple[str | None, int, int]] = []
+        with open(filepath, "rb") as fd:
+            mm: mmap.mmap = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                buf: np.ndarray | None = None
+                if numba is not None:
+                    buf = np.frombuffer(mm, dtype=np.uint8)
+
+                size: int = mm.size()
+                current_name: str | None = None
+                block_start: int = -1
+                pos: int = 0
+                while pos < size:
+                    nl: int = mm.find(b"\n", pos)
+                    if nl == -1:
+                        nl = size
+
+                    if mm.find(b",", pos, nl) == -1:
+                        if block_start >= 0:
+                            blocks.append((current_name, block_start, pos))
+                            block_start = -1
+
+                        current_name = mm[pos:nl].decode("utf-8").rstrip("\r")
+                        if current_name in data:
+                            # A repeated ring name replaces the earlier ring (the
+                            # fresh Ring below), so drop the earlier blocks too:
+                            # filling them all into the final ring would merge
+                            # same-named blocks instead of keeping the last one.
+                            blocks = [
+                                block for block in blocks if block[0] != current_name
+                            ]
+
+                        data[current_name] = Ring()
+
+                    elif block_start < 0:
+                        block_start = pos
+
+                    pos = nl + 1
+
+                if block_start >= 0:
+                    blocks.append((current_name, block_start, size))
+
+                if not parallel or len(blocks) < 2:
+                    for name, start, end in blocks:
+                        _fill_ring(data[name], mm, buf, start, end)
+                    return data
+            finally:
+                # The numpy view holds a buffer export on the mapping; drop it before
+                # closing or mmap.close() raises BufferError.
+                del buf
+                mm.close()
+
+        workers: int = min(os.cpu_count() or 1, len(blocks))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(
+                _parse_segment,
+                [(str(filepath), start, end) for _, start, end in blocks],
+            )
+
+        for (name, _, _), (xs, ys, ids) in zip(blocks, results):
+            ring: Ring = data[name]
+            add_point = ring.add_point
+            _new_point = Point._from_xyi
+            for x, y, ID in zip(xs.tolist(), ys.tolist(), ids.tolist()):
+                add_point(_new_point(x, y, int(ID)))
 
         return data
+
+    @staticmethod
+    def read_many(
+        filenames: list[str | pathlib.Path],
+    ) -> dict[str, dict[str | None, Ring]]:
+        """
+        Read several geometry files concurrently. The files are handed to a thread
+        pool so their reads and numeric parses overlap (the parse kernel drops the
+        GIL, so the scaling is real, not just I/O overlap). A true io_uring batched
+        submission would cut the syscall count further, but there are no maintained
+        Python bindings to lean on, so a pool of blocking reads is the portable
+        version of the same idea.
+
+        Args:
+            filenames:
+                Files to read geometric data from.
+
+        Returns:
+            data:
+                Geometric data from each file, keyed by the name it was given as.
+        """
+
+        if not filenames:
+            return {}
+
+        workers: int = min(os.cpu_count() or 1, len(filenames))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(Reader.read, filenames))
+
+        return {str(filename): data for filename, data in zip(filenames, results)}
+
+
+def _fill_ring(
+    ring: Ring, mm: mmap.mmap, buf: np.ndarray | None, start: int, end: int
+) -> None:
+    """
+    This parses a contiguous block of numeric lines and loads the points into a ring.
+    If numba is installed, the block is scanned in place by the compiled
+    [`_parse_numeric_block`][mesher.fileIO.reader._parse_numeric_block] kernel working
+    on a zero-copy view of the mapping; otherwise the block is decoded once and parsed
+    with `numpy.loadtxt` (or plain splits for small blocks). Either way the per-field
+    `float`/`int` conversions happen outside the interpreter.
+
+    Args:
+        ring:
+            ...
+        mm:
+            The memory-mapped geometry file.
+        buf:
+            A zero-copy uint8 view of the mapping (only when numba is available).
+        start:
+            The byte offset where the block starts.
+        end:
+            The byte offset just past the block.
+    """
+
+    # Bind the hot names once so the per-point loop skips the repeated global and
+    # attribute lookups.
+    add_point = ring.add_point
+    _new_point = Point._from_xyi
+
+    if buf is not None:
+        xs, ys, ids = _parse_numeric_block(buf[start:end])
+        for x, y, ID in zip(xs.tolist(), ys.tolist(), ids.tolist()):
+            add_point(_new_point(x, y, ID))
+        return
+
+    block: list[str] = mm[start:end].decode("utf-8").splitlines()
+    _int = int
+    if len(block) < 512:
+        # np.loadtxt pays a large fixed setup cost; for a small block a plain
+        # unpack-and-convert of the three fields is cheaper.
+        _float = float
+        for line in block:
+            x, y, ID = line.split(",")
+            add_point(_new_point(_float(x), _float(y), _int(ID)))
+        return
+
+    rows: np.ndarray = np.loadtxt(
+        io.StringIO("\n".join(block)), delimiter=",", dtype=np.float64, ndmin=2
+    )
+    for x, y, ID in rows.tolist():
+        add_point(_new_point(x, y, _int(ID)))
+
+
+def _parse_segment(
+    args: tuple[str, int, int]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    This is the process-pool worker behind `Reader.read(parallel=True)`. It re-maps
+    the geometry file in the worker process (so nothing but the byte range crosses
+    the process boundary) and parses its block into coordinate arrays.
+
+    Args:
+        args:
+            The `(filepath, start, end)` byte range to parse.
+
+    Returns:
+        xs:
+            The x-positions of the points.
+        ys:
+            The y-positions of the points.
+        ids:
+            The IDs of the points.
+    """
+
+    filepath, start, end = args
+    with open(filepath, "rb") as fd:
+        mm: mmap.mmap = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if numba is not None:
+                buf: np.ndarray = np.frombuffer(mm, dtype=np.uint8)
+                try:
+                    return _parse_numeric_block(buf[start:end])
+                finally:
+                    del buf
+
+            block: list[str] = mm[start:end].decode("utf-8").splitlines()
+        finally:
+            mm.close()
+
+    count: int = len(block)
+    fields: list[list[str]] = [line.split(",") for line in block]
+    xs: np.ndarray = np.fromiter(
+        map(float, (f[0] for f in fields)), dtype=np.float64, count=count
+    )
+    ys: np.ndarray = np.fromiter(
+        map(float, (f[1] for f in fields)), dtype=np.float64, count=count
+    )
+    ids: np.ndarray = np.fromiter(
+        map(int, (f[2] for f in fields)), dtype=np.int64, count=count
+    )
+    return xs, ys, ids
+
+
+def _parse_numeric_block(
+    buf: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    This parses a block of "x,y,ID" bytes into three arrays. The compiled
+    [`_scan_numeric_block`][mesher.fileIO.reader._scan_numeric_block] kernel does the
+    whole scan and converts every field that fits its exactly-rounded fast path; the
+    few rows it flags as falling off that path (very long mantissas or extreme
+    exponents) are re-parsed here with `float()`, which is correctly rounded for
+    everything. Every value therefore matches what `float()` returns, so files
+    written through `str(float)` round-trip unchanged whether or not numba is
+    installed.
+
+    Args:
+        buf:
+            The raw bytes of the block as a uint8 array.
+
+    Returns:
+        xs:
+            The x-positions of the points.
+        ys:
+            The y-positions of the points.
+        ids:
+            The IDs of the points.
+    """
+
+    xs, ys, ids, starts, slow = _scan_numeric_block(buf)
+    for r in np.flatnonzero(slow).tolist():
+        fields: list[str] = (
+            bytes(buf[starts[r] : starts[r + 1]]).decode("utf-8").split(",")
+        )
+        xs[r] = float(fields[0])
+        ys[r] = float(fields[1])
+        ids[r] = int(float(fields[2]))
+
+    return xs, ys, ids
+
+
+def _scan_numeric_block(
+    buf: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    This scans a block of "x,y,ID" bytes and fills three preallocated arrays with the
+    parsed values. The number conversion is a hand-rolled atof (integer mantissa plus
+    one power-of-ten scale) so that numba can compile the whole scan to machine code.
+    The final conversion divides (or multiplies) the exact integer mantissa by an
+    exact power of ten, which is a single correctly-rounded float operation — but
+    only while the mantissa stays exactly representable (15 digits or fewer) and the
+    power of ten is exact (|exponent| <= 22). A field outside those bounds would pick
+    up a second rounding step, so its row is flagged in the returned `slow` mask for
+    the caller to re-parse with `float()` instead of being trusted.
+
+    Args:
+        buf:
+            The raw bytes of the block as a uint8 array.
+
+    Returns:
+        xs:
+            The x-positions of the points.
+        ys:
+            The y-positions of the points.
+        ids:
+            The IDs of the points.
+        starts:
+            The byte offset where each row starts, with the block size appended, so
+            `buf[starts[r]:starts[r + 1]]` is row `r`.
+        slow:
+            True for each row with a field outside the exact fast path.
+    """
+
+    size: int = buf.size
+    count: int = 0
+    for i in range(size):
+        if buf[i] == 10:
+            count += 1
+
+    if size > 0 and buf[size - 1] != 10:
+        count += 1
+
+    xs: np.ndarray = np.empty(count, dtype=np.float64)
+    ys: np.ndarray = np.empty(count, dtype=np.float64)
+    ids: np.ndarray = np.empty(count, dtype=np.int64)
+    starts: np.ndarray = np.empty(count + 1, dtype=np.int64)
+    slow: np.ndarray = np.zeros(count, dtype=np.bool_)
+    starts[count] = size
+
+    i = 0
+    row: int = 0
+    col: int = 0
+    while i < size and row < count:
+        while i < size and (buf[i] == 32 or buf[i] == 13):
+            i += 1
+
+        if col == 0:
+            starts[row] = i
+
+        sign: float = 1.0
+        if i < size and buf[i] == 45:
+            sign = -1.0
+            i += 1
+        elif i < size and buf[i] == 43:
+            i += 1
+
+        # The mantissa accumulates in an int64 so every digit lands exactly; digits
+        # past the 18th cannot fit and are folded into the scale (integer part) or
+        # dropped (fraction), which only sheds precision a float64 never had.
+        mant: int = 0
+        ndigits: int = 0
+        scale: int = 0
+        while i < size and 48 <= buf[i] <= 57:
+            if ndigits < 18:
+                mant = mant * 10 + (buf[i] - 48)
+                ndigits += 1
+            else:
+                scale -= 1
+            i += 1
+
+        if i < size and buf[i] == 46:
+            i += 1
+            while i < size and 48 <= buf[i] <= 57:
+                if ndigits < 18:
+                    mant = mant * 10 + (buf[i] - 48)
+                    ndigits += 1
+                    scale += 1
+                i += 1
+
+        exp: int = 0
+        if i < size and (buf[i] == 101 or buf[i] == 69):
+            i += 1
+            esign: int = 1
+            if i < size and buf[i] == 45:
+                esign = -1
+                i += 1
+            elif i < size and buf[i] == 43:
+                i += 1
+
+            while i < size and 48 <= buf[i] <= 57:
+                exp = exp * 10 + (buf[i] - 48)
+                i += 1
+
+            exp *= esign
+
+        # One correctly-rounded multiply/divide by an exact power of ten (10**k is
+        # exact in float64 for k <= 22); scaling with 10.0 ** (exp - scale) directly
+        # would round the power itself and corrupt ordinary decimals like 8.2.
+        exp -= scale
+        if ndigits > 15 or exp > 22 or exp < -22:
+            # Off the exact fast path: the int->float mantissa conversion or the
+            # inexact power would add a second rounding step. Flag the row for a
+            # float() re-parse rather than storing a maybe-1-ulp-off value.
+            slow[row] = True
+
+        value: float
+        if exp >= 0:
+            value = sign * (mant * 10.0 ** exp)
+        else:
+            value = sign * (mant / 10.0 ** -exp)
+        if col == 0:
+            xs[row] = value
+        elif col == 1:
+            ys[row] = value
+        else:
+            ids[row] = np.int64(value)
+
+        # Trailing padding and the CR of a CRLF terminator sit between the value and
+        # the separator; consume them here so a CR is never mistaken for a row
+        # break (which would leave phantom zero fields and unparsed rows behind).
+        while i < size and (buf[i] == 32 or buf[i] == 13):
+            i += 1
+
+        if i < size and buf[i] == 44:
+            col += 1
+            i += 1
+        elif i < size:
+            row += 1
+            col = 0
+            i += 1
+
+    return xs, ys, ids, starts, slow
+
+
+if numba is not None:
+    _scan_numeric_block = numba.njit(cache=True, nogil=True)(_scan_numeric_block)
@@ -0,0 +1,149 @@
+"""
+Compiled inner loops for the ring geometry. Each kernel takes the SoA coordinate
+arrays and does one pass in plain scalar code, which numba (when installed) compiles
+to machine code with the GIL released. Without numba the plain-Python loops would be
+slower than the vectorized numpy expressions, so callers should only dispatch here
+when `numba is not None` and otherwise keep their numpy paths.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None  # type: ignore[assignment]
+
+
+def shoelace(xs: np.ndarray, ys: np.ndarray) -> float:
+    """
+    This computes the signed (shoelace) area of the closed ring described by the
+    coordinate arrays.
+
+    Args:
+        xs:
+            The x-positions of the points in node order.
+        ys:
+            The y-positions of the points in node order.
+
+    Returns:
+        area:
+            The signed area of the ring.
+    """
+
+    n: int = xs.size
+    ret: float = 0.0
+    for i in range(n):
+        j: int = i + 1 if i + 1 < n else 0
+        ret += xs[i] * ys[j] - xs[j] * ys[i]
+
+    return 0.5 * ret
+
+
+def is_convex(xs: np.ndarray, ys: np.ndarray) -> bool:
+    """
+    This checks if the closed ring described by the coordinate arrays is convex, by
+    accumulating the turn signs of consecutive edges and bailing out as soon as both
+    signs have been seen.
+
+    Args:
+        xs:
+            The x-positions of the points in node order.
+        ys:
+            The y-positions of the points in node order.
+
+    Returns:
+        flag:
+            ...
+    """
+
+    n: int = xs.size
+    seen: int = 0
+    for i in range(n):
+        j: int = i + 1 if i + 1 < n else 0
+        k: int = j + 1 if j + 1 < n else 0
+        cross: float = (xs[j] - xs[i]) * (ys[k] - ys[j]) - (ys[j] - ys[i]) * (
+            xs[k] - xs[j]
+        )
+        if cross > 0:
+            seen |= 1
+        else:
+            seen |= 2
+
+        if seen == 3:
+            return False
+
+    return True
+
+
+def find_point(
+    xs: np.ndarray, ys: np.ndarray, x: float, y: float, tol_sq: float
+) -> int:
+    """
+    This scans the coordinate arrays for the first point within tolerance of the
+    query position, matching the squared-distance comparison that point equality
+    uses.
+
+    Args:
+        xs:
+            The x-positions of the points in node order.
+        ys:
+            The y-positions of the points in node order.
+        x:
+            The x-position of the query point.
+        y:
+            The y-position of the query point.
+        tol_sq:
+            The squared distance below which two points count as equal.
+
+    Returns:
+        index:
+            The index of the first match, or -1 if no point is within tolerance.
+    """
+
+    n: int = xs.size
+    for i in range(n):
+        dx: float = xs[i] - x
+        dy: float = ys[i] - y
+        if dx * dx + dy * dy < tol_sq:
+            return i
+
+    return -1
+
+
+def collinear_mask(xs: np.ndarray, ys: np.ndarray, tol: float) -> np.ndarray:
+    """
+    This flags every vertex that sits in the middle of a straight (neighbor, vertex,
+    neighbor) triple, within tolerance.
+
+    Args:
+        xs:
+            The x-positions of the points in node order.
+        ys:
+            The y-positions of the points in node order.
+        tol:
+            The cross-product magnitude below which a triple counts as straight.
+
+    Returns:
+        mask:
+            True for each vertex that is a collinear middle.
+    """
+
+    n: int = xs.size
+    mask: np.ndarray = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        h: int = i - 1 if i > 0 else n - 1
+        j: int = i + 1 if i + 1 < n else 0
+        cross: float = (xs[h] - xs[i]) * (ys[h] - ys[j]) - (ys[h] - ys[i]) * (
+            xs[h] - xs[j]
+        )
+        if -tol < cross < tol:
+            mask[i] = True
+
+    return mask
+
+
+if numba is not None:
+    shoelace = numba.njit(cache=True, nogil=True)(shoelace)
+    is_convex = numba.njit(cache=True, nogil=True)(is_convex)
+    find_point = numba.njit(cache=True, nogil=True)(find_point)
+    collinear_mask = numba.njit(cache=True, nogil=True)(collinear_mask)
@@ -3,10 +3,25 @@ from __future__ import annotations
 import abc
 from typing import Iterable
 
+import numpy as np
+
 
 class IPoint(metaclass=abc.ABCMeta):
 
-    """This is the interface for the [`Point`][mesher.geometry.point.Point] class."""
+    """This is the interface for the [`Point`][mesher.geometry.point.Point] class.
+
+    Implementations expose `ID`, `x`, and `y` as plain data attributes. They are
+    deliberately not abstract properties: routing every coordinate read through a
+    descriptor would put avoidable dispatch on the hottest paths in the geometry
+    kernels. The class-level annotations below declare them for the type checker
+    without creating class attributes (so they stay compatible with empty
+    `__slots__`)."""
+
+    __slots__ = ()
+
+    ID: int
+    x: float
+    y: float
 
     @abc.abstractmethod
     def __init__(self, *, x: float, y: float, ID: int) -> None:
@@ -39,32 +54,13 @@ class IPoint(metaclass=abc.ABCMeta):
 
         ...
 
-    @property
-    @abc.abstractmethod
-    def ID(self) -> int:
-        """This gets the ID of the point."""
-
-        ...
-
-    @property
-    @abc.abstractmethod
-    def x(self) -> float:
-        """This gets the x-position of the point."""
-
-        ...
-
-    @property
-    @abc.abstractmethod
-    def y(self) -> float:
-        """This gets the y-position of the point."""
-
-        ...
-
 
 class IRing(metaclass=abc.ABCMeta):
 
     """This is the interface for the [`Ring`][mesher.geometry.ring.Ring] class."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def __init__(self) -> None:
         """Constructor..."""
@@ -147,6 +143,13 @@ class IRing(metaclass=abc.ABCMeta):
 
         ...
 
+    @abc.abstractmethod
+    def contains_points(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """This checks which of a batch of query points lie inside the closed
+        ring."""
+
+        ...
+
     @abc.abstractmethod
     def delete_point(self, location: int) -> None:
         """This deletes a point from a ring whether open or closed."""
@@ -165,6 +168,25 @@ class IRing(metaclass=abc.ABCMeta):
 
         ...
 
+    @abc.abstractmethod
+    def fingerprint(self) -> int:
+        """This computes a rotation-invariant fingerprint of the ring, for use as a
+        duplicate-detection prefilter."""
+
+        ...
+
+    @abc.abstractmethod
+    def force_ccw(self) -> None:
+        """This puts a closed ring into CCW orientation, reversing only if needed."""
+
+        ...
+
+    @abc.abstractmethod
+    def force_cw(self) -> None:
+        """This puts a closed ring into CW orientation, reversing only if needed."""
+
+        ...
+
     @abc.abstractmethod
     def insert_point(self, point: IPoint, location: int) -> None:
         """This inserts a point into the ring."""
@@ -1,22 +1,38 @@
+from typing import final
+
 from .abc import IPoint
 
 # The tolerance that the x- and y-positions should be within in order to be considered
 # equal when comparing two points.
 TOL: float = 1e-10
 
+# Squared tolerance, for comparisons against a squared distance.
+TOL_SQ: float = TOL * TOL
+
 
+@final
 class Point(IPoint):
 
     """
     This represents a two-dimensional point with an ID attached so the user can see
     which figure the point is a part of after meshing.
 
+    The `ID`, `x`, and `y` attributes are plain slots rather than properties: they are
+    read in every geometry inner loop and a slot load is a single C-level lookup with
+    no descriptor dispatch. Points are immutable once constructed — the ring derived
+    caches (the point set, the quantized location index, the fused geometry pass) key
+    on a ring mutation counter that an in-place coordinate write would never bump, so
+    such a write would leave them silently stale. A `__setattr__` guard enforces this
+    in debug runs and compiles out under `python -O`, like the `Node` setter guards.
+
     Attributes:
         ID:     The ID of the point.
         x:      The x-position of the point (in meters).
         y:      The y-position of the point (in meters).
     """
 
+    __slots__ = ("ID", "x", "y")
+
     def __init__(self, *, x: float, y: float, ID: int) -> None:
         """
         Constructor...
@@ -41,7 +57,7 @@ class Point(IPoint):
             ```
         """
 
-        self._ID: int = ID
+        self.ID: int = ID
         """
         The ID of the point. If the point is user-generated, it should be positive. If
         the point is generated somewhere within the code, it should be negative.
@@ -50,7 +66,7 @@ class Point(IPoint):
             int
         """
 
-        self._x: float = x
+        self.x: float = x
         """
         The x-position of the point (in meters).
 
@@ -58,11 +74,37 @@ class Point(IPoint):
             float
         """
 
-        self._y: float = y
+        self.y: float = y
         """
         The y-position of the point (in meters)
         """
 
+    if __debug__:
+
+        def __setattr__(self, name: str, value: object) -> None:
+            """
+            This rejects rebinding an attribute that is already set, keeping points
+            immutable after construction (see the class docstring for why the ring
+            caches depend on that). The override only exists in debug runs; under
+            `python -O` the class has no `__setattr__` at all, so construction keeps
+            its plain C-level slot stores.
+
+            Args:
+                name:
+                    ...
+                value:
+                    ...
+
+            Raises:
+                AttributeError:
+                    Point attributes are read-only!
+            """
+
+            if hasattr(self, name):
+                raise AttributeError(f"Point.{name} is read-only!")
+
+            object.__setattr__(self, name, value)
+
     def __add__(self, other: IPoint) -> IPoint:
         """
         This adds together two points component-wise. This will assign the new point
@@ -88,12 +130,15 @@ class Point(IPoint):
             ```
         """
 
-        return Point(x=self._x + other.x, y=self._y + other.y, ID=self._ID + other.ID)
+        return Point._from_xyi(self.x + other.x, self.y + other.y, self.ID + other.ID)
 
     def __eq__(self, other: object) -> bool:
         """
         This checks to see if two points have the same x- and y-positions (within a
-        certain tolerance) regardless of their ID.
+        certain tolerance) regardless of their ID. Comparing a point against itself
+        (the common case when scanning a ring for a node it holds) short-circuits
+        before any arithmetic, and the tolerance check is a single fused
+        squared-distance compare rather than two abs/branch pairs.
 
         TODO: update this when we can handle other units (e.g., feet, cm, ...)?
 
@@ -117,10 +162,30 @@ class Point(IPoint):
             ```
         """
 
+        if other is self:
+            return True
+
         if not isinstance(other, IPoint):
             return NotImplemented
 
-        return abs(self._x - other.x) < TOL and abs(self._y - other.y) < TOL
+        dx: float = self.x - other.x
+        dy: float = self.y - other.y
+        return dx * dx + dy * dy < TOL_SQ
+
+    def __hash__(self) -> int:
+        """
+        This hashes the point by its x- and y-positions quantized to the comparison
+        tolerance, so points that compare equal through `__eq__` almost always land in
+        the same hash bucket. Two points within tolerance of each other can still
+        straddle a quantization boundary and hash differently, so hash-based lookups
+        must treat a miss as "maybe" and fall back to a tolerance-aware scan.
+
+        Returns:
+            ret:
+                ...
+        """
+
+        return hash((round(self.x / TOL), round(self.y / TOL)))
 
     def __str__(self) -> str:
         """
@@ -137,7 +202,7 @@ class Point(IPoint):
             ```
         """
 
-        return f"Point(x={self._x}, y={self._y}, ID={self._ID})"
+        return f"Point(x={self.x}, y={self.y}, ID={self.ID})"
 
     def __sub__(self, other: IPoint) -> IPoint:
         """
@@ -164,68 +229,75 @@ class Point(IPoint):
             ```
         """
 
-        return Point(x=self._x - other.x, y=self._y - other.y, ID=self._ID + other.ID)
+        return Point._from_xyi(self.x - other.x, self.y - other.y, self.ID + other.ID)
 
     @property
-    def ID(self) -> int:
+    def _ID(self) -> int:
         """
-        This gets the ID of the point.
+        Backwards-compatible alias for the old private `_ID` attribute.
 
         Type:
             int
-
-        Example:
-            ```py
-            >>> point = Point(x=3.2, y=-4.6, ID=47)
-            >>> point.ID
-            47
-            ```
         """
 
-        return self._ID
+        return self.ID
 
     @property
-    def x(self) -> float:
+    def _x(self) -> float:
         """
-        This gets the x-position of the point.
+        Backwards-compatible alias for the old private `_x` attribute.
 
         Type:
             float
-
-        Example:
-            ```py
-            >>> point = Point(x=3.2, y=-4.6, ID=47)
-            >>> point.x
-            3.2
-            ```
         """
 
-        return self._x
+        return self.x
 
     @property
-    def y(self) -> float:
+    def _y(self) -> float:
         """
-        This gets the y-position of the point.
+        Backwards-compatible alias for the old private `_y` attribute.
 
         Type:
             float
+        """
 
-        Example:
-            ```py
-            >>> point = Point(x=3.2, y=-4.6, ID=47)
-            >>> point.y
-            -4.6
-            ```
+        return self.y
+
+    @classmethod
+    def _from_xyi(cls, x: float, y: float, ID: int) -> "Point":
+        """
+        This constructs a point on the fast path used by internal hot loops (the
+        reader and the arithmetic operators). It allocates directly and assigns the
+        three slots positionally, skipping the kwargs binding that the keyword-only
+        `__init__` forces on every call.
+
+        Args:
+            x:
+                The x-position of the point (in meters).
+            y:
+                The y-position of the point (in meters).
+            ID:
+                The ID of the point.
+
+        Returns:
+            point:
+                ...
         """
 
-        return self._y
+        point: Point = object.__new__(cls)
+        point.x = x
+        point.y = y
+        point.ID = ID
+        return point
 
 
 def are_collinear(point1: IPoint, point2: IPoint, point3: IPoint) -> bool:
     """
     This checks to see if three points are collinear. It will do this by computing
     their cross product. If their cross product is zero, then they are collinear. This
-    will check this within tolerance.
+    will check this within tolerance. The deltas are formed on scalar components
+    rather than through `__sub__`, so no throwaway point objects are allocated.
 
     Args:
         point1:
@@ -240,9 +312,11 @@ def are_collinear(point1: IPoint, point2: IPoint, point3: IPoint) -> bool:
             ...
     """
 
-    delta1: IPoint = point1 - point2
-    delta2: IPoint = point1 - point3
-    return abs(cross_product(delta1, delta2)) < TOL
+    dx1: float = point1.x - point2.x
+    dy1: float = point1.y - point2.y
+    dx2: float = point1.x - point3.x
+    dy2: float = point1.y - point3.y
+    return abs(dx1 * dy2 - dy1 * dx2) < TOL
 
 
 def cross_product(point1: IPoint, point2: IPoint) -> float:
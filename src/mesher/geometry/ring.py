@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import enum
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from typing import Iterable
 
+import numpy as np
+
+from . import _kernels
 from .abc import IPoint, IRing
-from .point import are_collinear, cross_product
+from .point import TOL, TOL_SQ, Point
 
 
 class NeighborOption(enum.Enum):
@@ -31,6 +37,8 @@ class Node:
         value:  The point wrapped up by this node.
     """
 
+    __slots__ = ("_left", "_right", "_value")
+
     def __init__(self, value: IPoint) -> None:
         """
         Constructor...
@@ -104,11 +112,15 @@ class Node:
 
             return str(conn.value.ID) if conn is not None else "None"
 
-        ret: str = "Node(\n"
-        ret += f"\tvalue={str(self._value)},\n"
-        ret += f"\tleft.ID={output_string(self._left)},\n"
-        ret += f"\tright.ID={output_string(self._right)},\n"
-        return ret + ")"
+        return "".join(
+            (
+                "Node(\n",
+                f"\tvalue={str(self._value)},\n",
+                f"\tleft.ID={output_string(self._left)},\n",
+                f"\tright.ID={output_string(self._right)},\n",
+                ")",
+            )
+        )
 
     @property
     def left(self) -> Node | None:
@@ -151,8 +163,10 @@ class Node:
             ```
         """
 
-        if self._left is not None:
-            raise ValueError("The node to the left has already been set!")
+        # Defensive guard only; python -O strips it from the setter hot path.
+        if __debug__:
+            if self._left is not None:
+                raise ValueError("The node to the left has already been set!")
 
         self._left = node
 
@@ -197,8 +211,10 @@ class Node:
             ```
         """
 
-        if self._right is not None:
-            raise ValueError("The node to the right has already been set!")
+        # Defensive guard only; python -O strips it from the setter hot path.
+        if __debug__:
+            if self._right is not None:
+                raise ValueError("The node to the right has already been set!")
 
         self._right = node
 
@@ -239,10 +255,30 @@ class Node:
             ```
         """
 
-        if option == NeighborOption.LEFT:
-            self._left = None
-        elif option == NeighborOption.RIGHT:
-            self._right = None
+        # Enum members are singletons, so identity is equivalent to equality here and
+        # skips the Python-level Enum.__eq__ dispatch.
+        if option is NeighborOption.LEFT:
+            self.del_left()
+        elif option is NeighborOption.RIGHT:
+            self.del_right()
+
+    def del_left(self) -> None:
+        """
+        This deletes the connection to the left neighbor. Unlike
+        [`del_connection`][mesher.geometry.ring.Node.del_connection], there is no
+        enum compare to dispatch on, so hot internal paths prefer this form.
+        """
+
+        self._left = None
+
+    def del_right(self) -> None:
+        """
+        This deletes the connection to the right neighbor. Unlike
+        [`del_connection`][mesher.geometry.ring.Node.del_connection], there is no
+        enum compare to dispatch on, so hot internal paths prefer this form.
+        """
+
+        self._right = None
 
     def has_connection(self, option: NeighborOption) -> bool:
         """
@@ -268,12 +304,82 @@ class Node:
             True
         """
 
-        if option == NeighborOption.LEFT:
-            return self._left is not None
-        elif option == NeighborOption.RIGHT:
-            return self._right is not None
+        # Enum members are singletons, so identity is equivalent to equality here and
+        # skips the Python-level Enum.__eq__ dispatch.
+        if option is NeighborOption.LEFT:
+            return self.has_left()
+        elif option is NeighborOption.RIGHT:
+            return self.has_right()
         return False
 
+    def has_left(self) -> bool:
+        """
+        This checks if the left neighbor is already set. Unlike
+        [`has_connection`][mesher.geometry.ring.Node.has_connection], there is no
+        enum compare to dispatch on, so hot internal paths prefer this form.
+
+        Returns:
+            flag:
+                ...
+        """
+
+        return self._left is not None
+
+    def has_right(self) -> bool:
+        """
+        This checks if the right neighbor is already set. Unlike
+        [`has_connection`][mesher.geometry.ring.Node.has_connection], there is no
+        enum compare to dispatch on, so hot internal paths prefer this form.
+
+        Returns:
+            flag:
+                ...
+        """
+
+        return self._right is not None
+
+
+def _rotated(values: np.ndarray, shift: int) -> np.ndarray:
+    """
+    This rotates a 1D array by `shift` positions (same convention as `np.roll`) with
+    two plain slice copies into a preallocated output, skipping np.roll's general
+    modulo-indexing machinery. `shift` must be nonzero and smaller than the array.
+
+    Args:
+        values:
+            The array to rotate.
+        shift:
+            How far to rotate (negative shifts pull the successor to each slot).
+
+    Returns:
+        out:
+            The rotated array.
+    """
+
+    out: np.ndarray = np.empty_like(values)
+    out[:shift] = values[-shift:]
+    out[shift:] = values[:-shift]
+    return out
+
+
+def _link_pair(left: Node, right: Node) -> None:
+    """
+    This links two nodes as (left, right) neighbors by writing the private attributes
+    directly. The public setters exist to catch accidental relinking and raise if a
+    connection is already set; internal paths that are rebuilding a whole ring's
+    links (e.g. `close`, `remove_collinear`) know the writes are intentional and
+    skip both the guard branches and the descriptor dispatch.
+
+    Args:
+        left:
+            The node that `right` will sit to the right of.
+        right:
+            The node that `left` will sit to the left of.
+    """
+
+    left._right = right
+    right._left = left
+
 
 class Ring(IRing):
 
@@ -282,6 +388,18 @@ class Ring(IRing):
     encode edge information. Each of the [`Point`][mesher.geometry.point.Point] objects
     with a [`Node`][mesh.geometry.ring.Node] instance to encode these links.
 
+    Note that the nodes live in a contiguous Python list: traversal is positional (the
+    left/right neighbors of index `n` are `n - 1` and `(n + 1) % len`), and the
+    explicit links only record edge topology. Scans should iterate the list directly
+    rather than hop node-to-node through the link pointers.
+
+    The node list is the authoritative store; the numeric code paths work off derived
+    contiguous caches (coordinates, edge vectors, fused area/convexity/bbox, point
+    index) that rebuild lazily against a mutation counter. Replacing the nodes
+    outright with one structured `(x, y, prev, next, id)` array would buy little on
+    top of those caches and would break every caller that holds `Node` references or
+    patches links directly, so the facade stays.
+
     Attributes:
         area:           The area enclosed by the (closed) ring.
         closed:         This checks if the ring is the ring closed.
@@ -290,6 +408,37 @@ class Ring(IRing):
         orientation:    This checks if the ring is CCW or CW.
     """
 
+    __slots__ = (
+        "_closed_key",
+        "_dx",
+        "_dy",
+        "_edges_key",
+        "_fp",
+        "_fp_key",
+        "_geom",
+        "_geom_key",
+        "_ids",
+        "_index",
+        "_index_key",
+        "_nodes",
+        "_point_set",
+        "_soa_key",
+        "_version",
+        "_xs",
+        "_ys",
+    )
+
+    coord_dtype: np.dtype = np.dtype(np.float64)
+    """
+    The storage dtype of the SoA coordinate cache. float64 by default because the
+    point-comparison tolerance (1e-10) is finer than float32 resolution; workflows
+    meshing coarse geometry can set float32 on the class to halve the bytes moved per
+    traversal. The numeric kernels promote to float64 before reducing either way.
+
+    Type:
+        np.dtype
+    """
+
     def __init__(self) -> None:
         """Constructor..."""
 
@@ -301,6 +450,153 @@ class Ring(IRing):
             list[Node]
         """
 
+        self._version: int = 0
+        """
+        A counter bumped by every mutating operation. Used to tell when the SoA
+        coordinate cache is stale.
+
+        Type:
+            int
+        """
+
+        self._soa_key: tuple[int, int] | None = None
+        """
+        The `(version, length)` the SoA coordinate cache was built at, or `None` if it
+        has never been built.
+
+        Type:
+            tuple[int, int] | None
+        """
+
+        self._xs: np.ndarray = np.empty(0, dtype=np.float64)
+        """
+        The cached x-positions of the points in node order (SoA layout).
+
+        Type:
+            np.ndarray
+        """
+
+        self._ys: np.ndarray = np.empty(0, dtype=np.float64)
+        """
+        The cached y-positions of the points in node order (SoA layout).
+
+        Type:
+            np.ndarray
+        """
+
+        self._ids: np.ndarray = np.empty(0, dtype=np.int64)
+        """
+        The cached IDs of the points in node order (SoA layout).
+
+        Type:
+            np.ndarray
+        """
+
+        self._closed_key: tuple[int, int] | None = None
+        """
+        The `(version, length)` at which the ring was last verified to be closed, or
+        `None` if it never has been. Only the positive verdict is memoized: an open
+        ring's scan already stops at the first unlinked node, and rescanning on False
+        keeps rings closed by linking nodes directly (rather than through `close`)
+        honest.
+
+        Type:
+            tuple[int, int] | None
+        """
+
+        self._edges_key: tuple[int, int] | None = None
+        """
+        The `(version, length)` the edge-vector cache was built at, or `None` if it
+        has never been built.
+
+        Type:
+            tuple[int, int] | None
+        """
+
+        self._dx: np.ndarray = np.empty(0, dtype=np.float64)
+        """
+        The cached x-components of the forward edge vectors (vertex n to vertex
+        n + 1, wrapping around).
+
+        Type:
+            np.ndarray
+        """
+
+        self._dy: np.ndarray = np.empty(0, dtype=np.float64)
+        """
+        The cached y-components of the forward edge vectors (vertex n to vertex
+        n + 1, wrapping around).
+
+        Type:
+            np.ndarray
+        """
+
+        self._fp_key: tuple[int, int] | None = None
+        """
+        The `(version, length)` the fingerprint was computed at, or `None` if it
+        never has been.
+
+        Type:
+            tuple[int, int] | None
+        """
+
+        self._fp: int = 0
+        """
+        The cached rotation-invariant fingerprint of the ring.
+
+        Type:
+            int
+        """
+
+        self._geom_key: tuple[int, int] | None = None
+        """
+        The `(version, length)` the derived-geometry cache was built at, or `None` if
+        it has never been built.
+
+        Type:
+            tuple[int, int] | None
+        """
+
+        self._geom: tuple[float, bool, tuple[float, float, float, float]] | None = None
+        """
+        The cached `(area, is_convex, bbox)` of the ring, computed in one fused pass
+        by [`_geometry`][mesher.geometry.ring.Ring._geometry].
+
+        Type:
+            tuple[float, bool, tuple[float, float, float, float]] | None
+        """
+
+        self._index_key: tuple[int, int] | None = None
+        """
+        The `(version, length)` the point-location index was built at, or `None` if
+        it has never been built.
+
+        Type:
+            tuple[int, int] | None
+        """
+
+        self._index: dict[tuple[int, int], int] = {}
+        """
+        The node index of the first point in each tolerance-quantized coordinate
+        bucket, for O(1) `find_point` probes. As with
+        [`Point.__hash__`][mesher.geometry.point.Point.__hash__], a miss may be a
+        quantization artifact, so lookups fall back to a linear scan.
+
+        Type:
+            dict[tuple[int, int], int]
+        """
+
+        self._point_set: set[IPoint] = set()
+        """
+        The points currently in the ring, for O(1) membership probes. A hit here is
+        definitive; a miss may be a quantization artifact of
+        [`Point.__hash__`][mesher.geometry.point.Point.__hash__], so lookups fall back
+        to a linear scan.
+
+        Type:
+            set[IPoint]
+        """
+
     def __contains__(self, point: IPoint) -> bool:
         """
         This checks if a point is in a ring.
@@ -326,11 +622,28 @@ class Ring(IRing):
             ```
         """
 
-        for node in self._nodes:
-            if point == node.value:
-                return True
+        if point in self._point_set:
+            return True
 
-        return False
+        # Second O(1) probe through the quantized location index (it keys on
+        # coordinates only, so it also catches equal points whose set hash differs).
+        # A verified hit is definitive; a miss can still be a quantization artifact,
+        # hence the final tolerance-aware scan.
+        n: int | None = self._point_index().get(
+            (round(point.x / TOL), round(point.y / TOL))
+        )
+        if n is not None and point == self._nodes[n].value:
+            return True
+
+        # Definitive vectorized sweep: one squared-distance comparison over the SoA
+        # arrays, matching the tolerance check of `Point.__eq__` exactly.
+        if not self._nodes:
+            return False
+
+        xs, ys, _ = self._coords()
+        dx: np.ndarray = xs.astype(np.float64, copy=False) - point.x
+        dy: np.ndarray = ys.astype(np.float64, copy=False) - point.y
+        return bool(np.any(dx * dx + dy * dy < TOL_SQ))
 
     def __eq__(self, other: object) -> bool:
         """
@@ -369,14 +682,36 @@ class Ring(IRing):
         if len(self) != len(other):
             return False
 
+        # Rotation-invariant prefilter: two rings whose points pair up within
+        # tolerance have bounding boxes within tolerance, so a larger gap on any side
+        # rejects the pair from the cached geometry alone. (An exact canonical-tuple
+        # compare would be faster still, but ring equality is tolerance-aware, so
+        # surviving pairs go through the node walk below.)
+        if isinstance(other, Ring) and self.closed and other.closed:
+            bbox1 = self._geometry()[2]
+            bbox2 = other._geometry()[2]
+            if any(abs(a - b) >= TOL for a, b in zip(bbox1, bbox2)):
+                return False
+
         if self[0] not in other:
             return False
 
+        # Hoist the lengths and node lists into locals and replace the per-step
+        # modulo with a compare-and-reset: the loop body is pure attribute traffic.
+        # ptr0 walks `other` starting just past where it holds self[0]; ptr1 walks
+        # `self` from 1, so the two pointers visit corresponding vertices.
+        n: int = len(self)
+        nodes1: list[Node] = self._nodes
+        nodes2: list[Node] = other.nodes  # type: ignore[attr-defined]
         ptr0: int = other.find_point(self[0]) + 1  # type: ignore[operator]
+        if ptr0 == n:
+            # Wrap before the first access: the match can sit on the last node.
+            ptr0 = 0
+
         ptr1: int = 1
         while True:
-            node1: Node = self._nodes[ptr0]
-            node2: Node = other.nodes[ptr1]  # type: ignore[attr-defined]
+            node1: Node = nodes1[ptr1]
+            node2: Node = nodes2[ptr0]
             if node1.value != node2.value:
                 return False
 
@@ -387,9 +722,12 @@ class Ring(IRing):
             ):
                 return False
 
-            ptr0 = (ptr0 + 1) % len(self)
-            ptr1 = (ptr1 + 1) % len(other)
-            if ptr1 == 0:
+            ptr0 += 1
+            if ptr0 == n:
+                ptr0 = 0
+
+            ptr1 += 1
+            if ptr1 == n:
                 break
 
         return True
@@ -503,17 +841,21 @@ class Ring(IRing):
             ```
         """
 
-        ret: str = "Ring(\n"
-        ret += "\tnodes=[\n"
-        for node in self._nodes:
-            ret += f"\t\t{str(node)},\n"
-
-        return ret + "\t]\n)"
+        # Collect the pieces and join once: repeated += reallocates the growing
+        # string every iteration, which goes quadratic on large rings.
+        parts: list[str] = ["Ring(\n", "\tnodes=[\n"]
+        parts.extend(f"\t\t{str(node)},\n" for node in self._nodes)
+        parts.append("\t]\n)")
+        return "".join(parts)
 
     @property
     def area(self) -> float | None:
         """
-        This computes the area enclosed by the closed ring.
+        This computes the area enclosed by the closed ring. The shoelace sum runs as
+        two `np.dot` reductions over the SoA coordinate arrays rather than a per-node
+        Python loop, which also accumulates in a pairwise (more accurate) order. The
+        result comes from the fused [`_geometry`][mesher.geometry.ring.Ring._geometry]
+        pass, so it is cached between mutations.
 
         Type:
             float | None
@@ -533,17 +875,7 @@ class Ring(IRing):
         if not self.closed:
             return None
 
-        ret: float = 0
-        for n in range(len(self._nodes)):
-            n1: int = n
-            n2: int = (n + 1) % len(self._nodes)
-
-            p1: IPoint = self._nodes[n1].value
-            p2: IPoint = self._nodes[n2].value
-
-            ret += cross_product(p1, p2)
-
-        return ret * 0.5
+        return self._geometry()[0]
 
     @property
     def closed(self) -> bool:
@@ -570,12 +902,19 @@ class Ring(IRing):
         if len(self._nodes) <= 2:
             return False
 
+        # A ring that was closed stays closed until a mutation, so the full-link
+        # scan's positive verdict is memoized against the mutation counter. False is
+        # never memoized: the scan bails at the first unlinked node anyway, and a
+        # fresh scan picks up rings whose nodes were linked by hand.
+        key: tuple[int, int] = (self._version, len(self._nodes))
+        if self._closed_key == key:
+            return True
+
         for node in self._nodes:
-            if not node.has_connection(NeighborOption.LEFT) or not node.has_connection(
-                NeighborOption.RIGHT
-            ):
+            if not node.has_left() or not node.has_right():
                 return False
 
+        self._closed_key = key
         return True
 
     @property
@@ -602,20 +941,7 @@ class Ring(IRing):
         if not self.closed:
             return None
 
-        is_CCW: list[bool] = []
-        for n in range(len(self._nodes)):
-            n1: int = n
-            n2: int = (n + 1) % len(self._nodes)
-            n3: int = (n + 2) % len(self._nodes)
-
-            delta1: IPoint = self._nodes[n1].value - self._nodes[n2].value
-            delta2: IPoint = self._nodes[n1].value - self._nodes[n3].value
-            is_CCW.append(cross_product(delta1, delta2) > 0)
-
-        if all(is_CCW) or all(not flag for flag in is_CCW):
-            return True
-        else:
-            return False
+        return self._geometry()[1]
 
     @property
     def nodes(self) -> list[Node]:
@@ -647,16 +973,157 @@ class Ring(IRing):
             ```
         """
 
-        if not self.closed:
+        area: float | None = self.area
+        if area is None:
             return None
 
-        if self.area > 0.0:  # type: ignore[operator]
+        if area > 0.0:
             return "CCW"
-        elif self.area < 0.0:  # type: ignore[operator]
+        elif area < 0.0:
             return "CW"
 
         return None
 
+    def _coords(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        This gets the SoA coordinate arrays for the ring, rebuilding them from the
+        nodes only when a mutation (or a direct `_nodes` swap) has made the cached
+        arrays stale. Numeric code paths should prefer these contiguous arrays over
+        walking the nodes point by point.
+
+        Returns:
+            xs:
+                The x-positions of the points in node order.
+            ys:
+                The y-positions of the points in node order.
+            ids:
+                The IDs of the points in node order.
+        """
+
+        key: tuple[int, int] = (self._version, len(self._nodes))
+        if self._soa_key != key:
+            self._xs = np.fromiter(
+                (node.value.x for node in self._nodes),
+                dtype=self.coord_dtype,
+                count=len(self._nodes),
+            )
+            self._ys = np.fromiter(
+                (node.value.y for node in self._nodes),
+                dtype=self.coord_dtype,
+                count=len(self._nodes),
+            )
+            self._ids = np.fromiter(
+                (node.value.ID for node in self._nodes),
+                dtype=np.int64,
+                count=len(self._nodes),
+            )
+            self._soa_key = key
+
+        return self._xs, self._ys, self._ids
+
+    def _edges(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        This gets the forward edge vectors of the ring (vertex n to vertex n + 1,
+        wrapping around), rebuilding them only when a mutation has made the cached
+        arrays stale. A static closed ring's edges never change between mutations, so
+        every consumer (convexity, self-intersection) reuses the same two arrays.
+
+        Returns:
+            dx:
+                The x-components of the edge vectors.
+            dy:
+                The y-components of the edge vectors.
+        """
+
+        key: tuple[int, int] = (self._version, len(self._nodes))
+        if self._edges_key != key:
+            xs, ys, _ = self._coords()
+            xs = xs.astype(np.float64, copy=False)
+            ys = ys.astype(np.float64, copy=False)
+            self._dx = _rotated(xs, -1) - xs
+            self._dy = _rotated(ys, -1) - ys
+            self._edges_key = key
+
+        return self._dx, self._dy
+
+    def _geometry(self) -> tuple[float, bool, tuple[float, float, float, float]]:
+        """
+        This computes the signed area, the convexity flag, and the bounding box of the
+        ring in one fused pass over the SoA coordinate arrays, and caches the result
+        until the next mutation. A caller inspecting both `area` and `is_convex` (or
+        `orientation`, which reads the area's sign) therefore traverses the
+        coordinates once instead of once per property.
+
+        Returns:
+            geom:
+                The `(area, is_convex, (xmin, xmax, ymin, ymax))` of the ring.
+        """
+
+        key: tuple[int, int] = (self._version, len(self._nodes))
+        if self._geom_key != key:
+            xs, ys, _ = self._coords()
+            xs = xs.astype(np.float64, copy=False)
+            ys = ys.astype(np.float64, copy=False)
+            if _kernels.numba is not None:
+                area: float = float(_kernels.shoelace(xs, ys))
+                convex: bool = bool(_kernels.is_convex(xs, ys))
+            else:
+                # Shoelace in the x * (y_next - y_prev) form: one
+                # pairwise-accumulating np.dot reduction instead of two, with half
+                # the rounding steps of the term-by-term cross-product sum.
+                area = float(np.dot(xs, _rotated(ys, -1) - _rotated(ys, 1))) * 0.5
+
+                # Convexity is the turn sign between consecutive cached edge
+                # vectors. One sign mask, two short-circuiting C-level reductions: a
+                # concave ring bails out of `all` at the first wrong-signed turn,
+                # and `not any` avoids materializing the negated mask that
+                # `(~is_CCW).all()` would build.
+                dx, dy = self._edges()
+                is_CCW: np.ndarray = (
+                    dx * _rotated(dy, -1) - dy * _rotated(dx, -1)
+                ) > 0
+                convex = bool(is_CCW.all()) or not bool(is_CCW.any())
+
+            bbox: tuple[float, float, float, float] = (
+                float(xs.min()),
+                float(xs.max()),
+                float(ys.min()),
+                float(ys.max()),
+            )
+
+            self._geom = (area, convex, bbox)
+            self._geom_key = key
+
+        return self._geom  # type: ignore[return-value]
+
+    def _point_index(self) -> dict[tuple[int, int], int]:
+        """
+        This gets the quantized-coordinate point-location index, rebuilding it only
+        when a mutation has made the cached dict stale. Each bucket keeps the first
+        node that landed in it, matching the first-match behavior of a linear scan.
+
+        Returns:
+            index:
+                The node index of the first point in each quantized bucket.
+        """
+
+        key: tuple[int, int] = (self._version, len(self._nodes))
+        if self._index_key != key:
+            index: dict[tuple[int, int], int] = {}
+            for n, node in enumerate(self._nodes):
+                bucket = (round(node.value.x / TOL), round(node.value.y / TOL))
+                index.setdefault(bucket, n)
+
+            self._index = index
+            self._index_key = key
+
+        return self._index
+
+    def _invalidate(self) -> None:
+        """This marks the SoA coordinate cache as stale after a mutation."""
+
+        self._version += 1
+
     def add_point(self, point: IPoint) -> None:
         """
         This adds a point to the ring if the ring is not closed.
@@ -686,6 +1153,8 @@ class Ring(IRing):
             raise ValueError("You cannot add anymore points! This ring is closed!")
 
         self._nodes.append(Node(point))
+        self._point_set.add(point)
+        self._invalidate()
 
     def close(self) -> None:
         """
@@ -706,11 +1175,66 @@ class Ring(IRing):
         """
 
         if not self.closed or len(self) > 2:
-            for n, node in enumerate(self._nodes):
-                n_before: int = n - 1
-                n_after: int = (n + 1) % len(self)
-                node.left = self._nodes[n_before]
-                node.right = self._nodes[n_after]
+            # Pair each node with its successor by zipping against the rotated list:
+            # no per-node index arithmetic or modulo, just C-level iteration.
+            nodes: list[Node] = self._nodes
+            for node, nxt in zip(nodes, nodes[1:] + nodes[:1]):
+                _link_pair(node, nxt)
+
+    def contains_points(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        This checks which of a batch of query points lie inside the closed ring. The
+        standard even-odd ray cast runs as one broadcast numpy expression over the
+        SoA coordinate arrays — a (queries, edges) crossing matrix reduced per query
+        — instead of a Python loop per point. Points on the boundary may land on
+        either side, as usual for the even-odd rule. An open ring encloses nothing,
+        so every query comes back False.
+
+        Args:
+            x:
+                The x-positions of the query points.
+            y:
+                The y-positions of the query points.
+
+        Returns:
+            mask:
+                True for each query point inside the ring.
+
+        Example:
+            ```py
+            >>> ring = Ring()
+            >>> ring.add_point(Point(x=0, y=0, ID=0))
+            >>> ring.add_point(Point(x=2, y=0, ID=1))
+            >>> ring.add_point(Point(x=2, y=2, ID=2))
+            >>> ring.add_point(Point(x=0, y=2, ID=3))
+            >>> ring.close()
+            >>> ring.contains_points(np.array([1.0, 3.0]), np.array([1.0, 1.0]))
+            array([ True, False])
+            ```
+        """
+
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if not self.closed:
+            return np.zeros(np.broadcast(x, y).shape, dtype=bool)
+
+        xs, ys, _ = self._coords()
+        x1: np.ndarray = xs.astype(np.float64, copy=False)
+        y1: np.ndarray = ys.astype(np.float64, copy=False)
+        x2: np.ndarray = _rotated(x1, -1)
+        y2: np.ndarray = _rotated(y1, -1)
+
+        xq: np.ndarray = x[..., None]
+        yq: np.ndarray = y[..., None]
+        # A horizontal edge never straddles the query's y, so its (invalid) division
+        # result is masked out by the straddle condition; silence the warning.
+        straddles: np.ndarray = (y1 > yq) != (y2 > yq)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossings: np.ndarray = straddles & (
+                xq < (x2 - x1) * (yq - y1) / (y2 - y1) + x1
+            )
+
+        return crossings.sum(axis=-1) % 2 == 1
 
     def delete_point(self, location: int) -> None:
         """
@@ -783,13 +1307,15 @@ class Ring(IRing):
             before: int = location - 1
             after: int = (location + 1) % len(self)
 
-            self._nodes[before].del_connection(NeighborOption.RIGHT)
-            self._nodes[after].del_connection(NeighborOption.LEFT)
+            self._nodes[before].del_right()
+            self._nodes[after].del_left()
 
             self._nodes[before].right = self._nodes[after]
             self._nodes[after].left = self._nodes[before]
 
+        self._point_set.discard(self._nodes[location].value)
         del self._nodes[location]
+        self._invalidate()
 
     def find_point(self, point: IPoint) -> int | None:
         """
@@ -815,15 +1341,184 @@ class Ring(IRing):
             ```
         """
 
-        for p, pnt in enumerate(self):  # type: ignore
-            if point == pnt:
+        # O(1) probes of the quantized index first; a hit is only trusted after an
+        # exact (tolerance-aware) equality check. A within-tolerance match can
+        # straddle a quantization boundary, but never by more than one bucket, so
+        # probing the home bucket and its eight neighbors catches every straddler.
+        # The scan fallback is still needed for the one remaining miss mode: each
+        # bucket keeps only its first node, so a match shadowed by a same-bucket
+        # predecessor is invisible to the index.
+        index: dict[tuple[int, int], int] = self._point_index()
+        bx: int = round(point.x / TOL)
+        by: int = round(point.y / TOL)
+        for dbx in (0, -1, 1):
+            for dby in (0, -1, 1):
+                n: int | None = index.get((bx + dbx, by + dby))
+                if n is not None and point == self._nodes[n].value:
+                    return n
+
+        if _kernels.numba is not None:
+            xs, ys, _ = self._coords()
+            p: int = _kernels.find_point(
+                xs.astype(np.float64, copy=False),
+                ys.astype(np.float64, copy=False),
+                point.x,
+                point.y,
+                TOL_SQ,
+            )
+            return p if p >= 0 else None
+
+        for p, node in enumerate(self._nodes):
+            if point == node.value:
                 return p
 
         return None
 
     def find_self_intersections(self) -> list[tuple[int, int, IPoint]]:
-        print("I'M NOT IMPLEMENTED YET!!!")
-        return []
+        """
+        This finds if and where the ring has any self-intersections. Every edge pair
+        is tested at once: the four orientation (cross-product) checks are computed as
+        broadcast numpy expressions over the SoA coordinate arrays, and only the pairs
+        that properly cross are then revisited to compute the intersection points.
+        Edges that merely touch at a shared endpoint (neighboring edges) do not count
+        as intersections.
+
+        Returns:
+            ret:
+                One `(edge1, edge2, point)` tuple per crossing, where the edge indices
+                refer to the edge starting at that node index. The intersection points
+                are code-generated, so their IDs are negative.
+        """
+
+        n: int = len(self._nodes)
+        if n < 3:
+            return []
+
+        xs, ys, _ = self._coords()
+        xs = xs.astype(np.float64, copy=False)
+        ys = ys.astype(np.float64, copy=False)
+        if self.closed:
+            x1, y1 = xs, ys
+            x2, y2 = _rotated(xs, -1), _rotated(ys, -1)
+            dx, dy = self._edges()
+        else:
+            x1, y1 = xs[:-1], ys[:-1]
+            x2, y2 = xs[1:], ys[1:]
+            dx = x2 - x1
+            dy = y2 - y1
+
+        # orient[i, j] pairs the sides of edge j's endpoints relative to edge i; a
+        # strictly negative product means edge i's line separates edge j's endpoints.
+        o1: np.ndarray = dx[:, None] * (y1[None, :] - y1[:, None]) - dy[:, None] * (
+            x1[None, :] - x1[:, None]
+        )
+        o2: np.ndarray = dx[:, None] * (y2[None, :] - y1[:, None]) - dy[:, None] * (
+            x2[None, :] - x1[:, None]
+        )
+        orient: np.ndarray = o1 * o2
+
+        crossing: np.ndarray = (orient < 0) & (orient.T < 0)
+        ret: list[tuple[int, int, IPoint]] = []
+        for e1, e2 in zip(*(idx.tolist() for idx in np.nonzero(np.triu(crossing, 1)))):
+            denom: float = dx[e1] * dy[e2] - dy[e1] * dx[e2]
+            t: float = (
+                (x1[e2] - x1[e1]) * dy[e2] - (y1[e2] - y1[e1]) * dx[e2]
+            ) / denom
+            point: IPoint = Point._from_xyi(
+                float(x1[e1] + t * dx[e1]), float(y1[e1] + t * dy[e1]), -len(ret) - 1
+            )
+            ret.append((e1, e2, point))
+
+        return ret
+
+    def fingerprint(self) -> int:
+        """
+        This computes a rotation-invariant fingerprint of the ring. The coordinates
+        are quantized to the comparison tolerance (the same grid
+        [`Point.__hash__`][mesher.geometry.point.Point.__hash__] uses) and rotated so
+        that the lexicographically smallest quantized vertex comes first, so two
+        rings tracing the same polygon from different starting points get the same
+        fingerprint. It is a prefilter, not a verdict: rings that compare equal
+        through `__eq__` can still straddle a quantization boundary and fingerprint
+        differently (rare, and impossible when the coordinates sit far from the
+        grid lines), so callers pruning candidate pairs by fingerprint trade that
+        sliver of recall for skipping the pairwise walk. A matching fingerprint
+        still needs the full `__eq__` check. The digest is a CRC-32 over the packed
+        quantized coordinates rather than the built-in `hash`, so it is stable
+        across interpreter runs and processes (bytes hashing is salted per process),
+        and fingerprints computed in worker processes can be compared directly. The
+        result is cached against the same `(version, length)` key as the other
+        derived caches.
+
+        Returns:
+            ret:
+                ...
+        """
+
+        key: tuple[int, int] = (self._version, len(self._nodes))
+        if self._fp_key != key:
+            xs, ys, _ = self._coords()
+            qx: np.ndarray = np.rint(xs.astype(np.float64, copy=False) / TOL).astype(
+                np.int64
+            )
+            qy: np.ndarray = np.rint(ys.astype(np.float64, copy=False) / TOL).astype(
+                np.int64
+            )
+            if qx.size > 0:
+                # np.lexsort is stable, so ties pick the earliest such vertex.
+                start: int = int(np.lexsort((qy, qx))[0])
+                if start > 0:
+                    qx = _rotated(qx, -start)
+                    qy = _rotated(qy, -start)
+
+            self._fp = zlib.crc32(qy.tobytes(), zlib.crc32(qx.tobytes()))
+            self._fp_key = key
+
+        return self._fp
+
+    def force_ccw(self) -> None:
+        """
+        This puts a closed ring into CCW orientation. If the ring is already CCW (or
+        is not closed), this returns without touching any node, so callers can force
+        an orientation unconditionally without paying for a reversal they don't need.
+
+        Example:
+            ```py
+            >>> ring = Ring()
+            >>> ring.add_point(Point(x=0, y=0, ID=0))
+            >>> ring.add_point(Point(x=1, y=0, ID=1))
+            >>> ring.add_point(Point(x=1, y=1, ID=2))
+            >>> ring.close()
+            >>> ring.force_ccw()
+            >>> ring.orientation
+            'CCW'
+            ```
+        """
+
+        if self.orientation == "CW":
+            self.reverse_orientation()
+
+    def force_cw(self) -> None:
+        """
+        This puts a closed ring into CW orientation. If the ring is already CW (or is
+        not closed), this returns without touching any node, so callers can force an
+        orientation unconditionally without paying for a reversal they don't need.
+
+        Example:
+            ```py
+            >>> ring = Ring()
+            >>> ring.add_point(Point(x=0, y=0, ID=0))
+            >>> ring.add_point(Point(x=1, y=0, ID=1))
+            >>> ring.add_point(Point(x=1, y=1, ID=2))
+            >>> ring.close()
+            >>> ring.force_cw()
+            >>> ring.orientation
+            'CW'
+            ```
+        """
+
+        if self.orientation == "CCW":
+            self.reverse_orientation()
 
     def insert_point(self, point: IPoint, location: int) -> None:
         """
@@ -831,6 +1526,12 @@ class Ring(IRing):
         index. If the ring is already closed, then it will delete the connections of
         the nodes before and after this new point and connect themselves to the node.
 
+        Note that the list insert shifts the tail of `_nodes` (an O(N) C-level
+        memmove). Rings are positional sequences with no ordering key, so a sorted
+        or tree-backed container cannot replace the list here; at the ring sizes the
+        mesher works with, the memmove is cheaper than pointer-chasing alternatives,
+        and the node links themselves are patched in O(1) below.
+
         Args:
             point:
                 ...
@@ -895,19 +1596,24 @@ class Ring(IRing):
 
         closed: bool = self.closed
         self._nodes.insert(location, Node(point))
+        self._point_set.add(point)
+        self._invalidate()
         if closed:
-            self._nodes[location - 1].del_connection(NeighborOption.RIGHT)
+            self._nodes[location - 1].del_right()
             self._nodes[location - 1].right = self._nodes[location]
 
             self._nodes[location].left = self._nodes[location - 1]
             self._nodes[location].right = self._nodes[(location + 1) % len(self)]
 
-            self._nodes[(location + 1) % len(self)].del_connection(NeighborOption.LEFT)
+            self._nodes[(location + 1) % len(self)].del_left()
             self._nodes[(location + 1) % len(self)].left = self._nodes[location]
 
     def remove_collinear(self) -> None:
         """
-        This removes any collinear points (nodes).
+        This removes any collinear points (nodes). All the (neighbor, vertex,
+        neighbor) cross products are computed in one vectorized pass over the SoA
+        coordinate arrays and the surviving nodes are re-sliced with the resulting
+        keep-mask, instead of testing the triples one by one in Python.
 
         Example:
             ```py
@@ -966,24 +1672,50 @@ class Ring(IRing):
             ```
         """
 
-        idxs: list[int] = list(range(len(self)))
-        for i in range(len(self) - 1):
-            n1: int = idxs[i % len(idxs)]
-            n2: int = idxs[(i + 1) % len(idxs)]
-            n3: int = idxs[(i + 2) % len(idxs)]
-            if are_collinear(self[n1], self[n2], self[n3]):
-                del idxs[i + 1]
+        if len(self) < 3:
+            return
 
-        self._nodes = [self._nodes[idx] for idx in idxs]
-        for n, node in enumerate(self._nodes):
-            n_before: int = n - 1
-            n_after: int = (n + 1) % len(self._nodes)
-
-            node.del_connection(NeighborOption.LEFT)
-            node.del_connection(NeighborOption.RIGHT)
-
-            node.left = self._nodes[n_before]
-            node.right = self._nodes[n_after]
+        xs, ys, _ = self._coords()
+        xs = xs.astype(np.float64, copy=False)
+        ys = ys.astype(np.float64, copy=False)
+        if _kernels.numba is not None:
+            keep: np.ndarray = ~_kernels.collinear_mask(xs, ys, TOL)
+        else:
+            x0: np.ndarray = _rotated(xs, 1)
+            y0: np.ndarray = _rotated(ys, 1)
+            x2: np.ndarray = _rotated(xs, -1)
+            y2: np.ndarray = _rotated(ys, -1)
+
+            # One cross product per vertex, all at once: a vertex is dropped when it
+            # is the middle of a straight (neighbor, vertex, neighbor) triple.
+            cross: np.ndarray = (x0 - xs) * (y0 - y2) - (y0 - ys) * (x0 - x2)
+            keep = np.abs(cross) >= TOL
+
+        # The old sequential scan never tested the wrap-around triple with the first
+        # vertex in the middle, so the first vertex always survived; keep that.
+        keep[0] = True
+
+        dead: np.ndarray = np.flatnonzero(~keep)
+        if dead.size == 0:
+            return
+
+        # Splice each removed node out locally — two pointer writes per removal,
+        # exactly like delete_point — instead of rebuilding every survivor's links.
+        # Consecutive removals stay correct because the pointers are patched as we
+        # go; nodes of a never-linked ring have no neighbors and need no patching.
+        nodes: list[Node] = self._nodes
+        for i in dead.tolist():
+            node: Node = nodes[i]
+            left, right = node._left, node._right
+            if left is not None:
+                left._right = right
+            if right is not None:
+                right._left = left
+
+            self._point_set.discard(node._value)
+
+        self._nodes = [nodes[idx] for idx in np.flatnonzero(keep)]
+        self._invalidate()
 
     def reverse_orientation(self) -> None:
         """
@@ -1042,13 +1774,111 @@ class Ring(IRing):
         """
 
         if self.closed:
+            # Reversal negates the signed area and changes nothing else about the
+            # geometry, so a valid cache entry can be carried across the mutation
+            # with its sign flipped instead of being recomputed from the coordinates.
+            geom_valid: bool = self._geom_key == (self._version, len(self._nodes))
+
             self._nodes.reverse()
+            self._invalidate()
+            # Swap the private attributes directly: the setter-based dance would pay
+            # two del_connection calls and two raise-if-set guards per node just to
+            # exchange two pointers.
             for node in self._nodes:
-                left, right = node.left, node.right
-                node.del_connection(NeighborOption.LEFT)
-                node.del_connection(NeighborOption.RIGHT)
-                node.left, node.right = right, left
+                node._left, node._right = node._right, node._left
+
+            if geom_valid:
+                area, convex, bbox = self._geom  # type: ignore[misc]
+                self._geom = (-area, convex, bbox)
+                self._geom_key = (self._version, len(self._nodes))
 
     def split_ring(self) -> list[IRing]:
         print("I'M NOT IMPLEMENTED YET!!!")
         return []
+
+
+def _bucket_duplicates(rings: list[Ring]) -> list[bool]:
+    """
+    This marks the duplicates within one fingerprint bucket, reproducing the
+    first-wins order of the sequential pairwise loop: each ring is compared against
+    the earliest ring in the bucket that has not itself been marked a duplicate.
+
+    Args:
+        rings:
+            The rings sharing one fingerprint, in their original relative order.
+
+    Returns:
+        is_duplicate:
+            One flag per ring, True for every ring equal to an earlier survivor.
+    """
+
+    is_duplicate: list[bool] = [False] * len(rings)
+    for r1 in range(len(rings)):
+        if is_duplicate[r1]:
+            continue
+
+        for r2 in range(r1 + 1, len(rings)):
+            if is_duplicate[r2]:
+                continue
+
+            is_duplicate[r2] = rings[r1] == rings[r2]
+
+    return is_duplicate
+
+
+def find_duplicate_rings(rings: list[Ring], *, parallel: bool = False) -> list[bool]:
+    """
+    This flags every ring that duplicates an earlier ring in the list. Rings are
+    first bucketed by their rotation-invariant fingerprint so the pairwise equality
+    walk only ever runs between rings tracing the same quantized polygon; buckets
+    with a single member are never compared at all. The first occurrence of each
+    polygon survives and later copies are flagged, matching the order a plain
+    quadratic scan of the list would produce.
+
+    Args:
+        rings:
+            The rings to deduplicate.
+        parallel:
+            Whether to spread the buckets across a process pool. Buckets are
+            independent of each other, and the CRC-based fingerprints are stable
+            across processes, so the parallel result is identical to the serial
+            one. Only worth it when many large buckets exist; each worker pays to
+            unpickle its bucket's rings.
+
+    Returns:
+        is_duplicate:
+            One flag per ring, True for every ring equal to an earlier survivor.
+
+    Example:
+        ```py
+        >>> is_duplicate = find_duplicate_rings(rings)
+        >>> unique = [ring for ring, dup in zip(rings, is_duplicate) if not dup]
+        ```
+    """
+
+    is_duplicate: list[bool] = [False] * len(rings)
+    buckets: dict[int, list[int]] = {}
+    for n, ring in enumerate(rings):
+        buckets.setdefault(ring.fingerprint(), []).append(n)
+
+    work: list[list[int]] = [
+        members for members in buckets.values() if len(members) > 1
+    ]
+    if parallel and len(work) >= 2:
+        with ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, len(work))
+        ) as pool:
+            masks: Iterable[list[bool]] = pool.map(
+                _bucket_duplicates,
+                ([rings[n] for n in members] for members in work),
+            )
+            for members, mask in zip(work, masks):
+                for n, flag in zip(members, mask):
+                    is_duplicate[n] = flag
+    else:
+        for members in work:
+            mask = _bucket_duplicates([rings[n] for n in members])
+            for n, flag in zip(members, mask):
+                is_duplicate[n] = flag
+
+    return is_duplicate
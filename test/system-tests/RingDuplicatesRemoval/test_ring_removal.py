@@ -1,8 +1,9 @@
+import mmap
 import os
 
 from mesher.fileIO.reader import Reader
 from mesher.fileIO.writer import Writer
-from mesher.geometry.ring import Ring
+from mesher.geometry.ring import Ring, find_duplicate_rings
 
 input_filename: str = "test/system-tests/data/rings_with_duplicates.txt"
 result_filename: str = "test/system-tests/RingDuplicatesRemoval/results.txt"
@@ -10,20 +11,23 @@ output_filename: str = "test/system-tests/RingDuplicatesRemoval/output.txt"
 
 
 def compare_files() -> bool:
-    with open(result_filename, "r") as f_results:
-        lines_results: list[str] = f_results.readlines()
-
-    with open(output_filename, "r") as f_output:
-        lines_output: list[str] = f_output.readlines()
-
-    if len(lines_output) != len(lines_results):
-        return False
-
-    for lineno in range(len(lines_output)):
-        if lines_output[lineno] != lines_results[lineno]:
+    # The writer emits byte-exact output, so the comparison does not need lines at
+    # all: map both files and let the bytes equality run as a single C-level memcmp
+    # over the mappings. An mmap of length zero is disallowed, so empty files fall
+    # back to the (trivially equal) empty-bytes compare.
+    with open(result_filename, "rb") as f_results, open(output_filename, "rb") as f_out:
+        size_results: int = os.fstat(f_results.fileno()).st_size
+        size_output: int = os.fstat(f_out.fileno()).st_size
+        if size_output != size_results:
             return False
 
-    return True
+        if size_results == 0:
+            return True
+
+        with mmap.mmap(
+            f_results.fileno(), 0, access=mmap.ACCESS_READ
+        ) as m_results, mmap.mmap(f_out.fileno(), 0, access=mmap.ACCESS_READ) as m_out:
+            return m_results[:] == m_out[:]
 
 
 def test_ring_removal():
@@ -44,19 +48,9 @@ def test_ring_removal():
         rings.append(ring)
 
     # TODO: this will eventually be moved to mesh when the functionality is there...
-    is_duplicate: list[bool] = [False] * len(rings)
-    for r1 in range(len(rings)):
-        if is_duplicate[r1]:
-            continue
-
-        for r2 in range(r1 + 1, len(rings)):
-            if is_duplicate[r2]:
-                continue
-
-            # TODO: need to be able to handle reversed polygons... maybe this gets
-            # floated up to `Polygon` class since this is the technical definition for
-            # ring equality.
-            is_duplicate[r2] = rings[r1] == rings[r2]
+    # TODO: need to be able to handle reversed polygons... maybe this gets floated up
+    # to `Polygon` class since this is the technical definition for ring equality.
+    is_duplicate: list[bool] = find_duplicate_rings(rings)
 
     filtered_data: dict[str, Ring] = {
         names[n]: rings[n] for n in range(len(rings)) if not is_duplicate[n]
@@ -5,6 +5,7 @@ from unittest import mock
 import pytest
 
 from mesher.fileIO.reader import Reader
+from mesher.fileIO.writer import Writer
 from mesher.geometry.point import Point
 from mesher.geometry.ring import Ring
 
@@ -23,6 +24,140 @@ class TestReader:
         filepath: pathlib.Path = pathlib.Path(os.getcwd()) / self.filename
         assert exc.value.args[0] == f"{filepath} doesn't exist!"
 
+    @pytest.mark.parametrize("compiled", [True, False])
+    def test_reader_read_decimal_round_trip(self, compiled, monkeypatch):
+        """Test that non-integer decimals parse to the exact floats `float()` returns
+        (on both the compiled and the fallback parse paths), so a file written
+        through `str(float)` round-trips byte-for-byte."""
+
+        if not compiled:
+            monkeypatch.setattr("mesher.fileIO.reader.numba", None)
+
+        decimal_filename = pathlib.Path("test/unit-tests/fileIO/test_decimals.txt")
+        round_trip_filename = pathlib.Path("test/unit-tests/fileIO/round_trip.txt")
+        points: list[tuple[float, float, int]] = [
+            (8.2, 0.3, 1),
+            (4.35, -0.1, 2),
+            (1e-05, 123.456, 3),
+            (-2500.0, 0.30000000000000004, 4),
+            # 16-17 significant digits and a sub-1e-22 decimal exponent: off the
+            # compiled scanner's exact fast path, covered by the float() re-parse.
+            (943305.0469559873, 1.0271471865319853e-06, 5),
+        ]
+        with open(decimal_filename, "w") as fd:
+            fd.write("foo\n")
+            fd.writelines(f"{x},{y},{ID}\n" for x, y, ID in points)
+
+        try:
+            data: dict[str, Ring] = Reader.read(decimal_filename)
+            assert [(p.x, p.y, p.ID) for p in data["foo"]] == points
+
+            Writer.write(round_trip_filename, data)
+            with open(decimal_filename, "rb") as f_in:
+                with open(round_trip_filename, "rb") as f_out:
+                    assert f_out.read() == f_in.read()
+        finally:
+            for filename in (decimal_filename, round_trip_filename):
+                if os.path.exists(filename):
+                    os.remove(filename)
+
+    def test_reader_read_parallel(self):
+        """Test that parallel parsing produces exactly the serial result."""
+
+        serial: dict[str, Ring] = Reader.read(self.filename)
+        parallel: dict[str, Ring] = Reader.read(self.filename, parallel=True)
+
+        assert list(parallel.keys()) == list(serial.keys())
+        for name in serial:
+            assert [(p.x, p.y, p.ID) for p in parallel[name]] == [
+                (p.x, p.y, p.ID) for p in serial[name]
+            ]
+
+    def test_reader_read_many(self):
+        """Test reading several files at once, keyed by the name each was given."""
+
+        assert Reader.read_many([]) == {}
+
+        other_filename = pathlib.Path("test/unit-tests/fileIO/test_other_data.txt")
+        with open(other_filename, "w") as fd:
+            fd.write("baz\n5,5,7\n6,5,8\n")
+
+        try:
+            data: dict[str, dict[str, Ring]] = Reader.read_many(
+                [self.filename, other_filename]
+            )
+            assert list(data.keys()) == [str(self.filename), str(other_filename)]
+            assert len(data[str(self.filename)]) == 2
+            assert len(data[str(self.filename)]["foo"]) == 3
+            assert len(data[str(self.filename)]["bar"]) == 4
+            assert len(data[str(other_filename)]) == 1
+            assert Point(x=5, y=5, ID=7) in data[str(other_filename)]["baz"]
+            assert Point(x=6, y=5, ID=8) in data[str(other_filename)]["baz"]
+        finally:
+            os.remove(other_filename)
+
+    @pytest.mark.parametrize("compiled", [True, False])
+    def test_reader_read_crlf(self, compiled, monkeypatch):
+        """Test that CRLF-terminated files parse identically to LF files on both the
+        compiled and the fallback parse paths."""
+
+        if not compiled:
+            monkeypatch.setattr("mesher.fileIO.reader.numba", None)
+
+        crlf_filename = pathlib.Path("test/unit-tests/fileIO/test_crlf.txt")
+        with open(crlf_filename, "w", newline="") as fd:
+            fd.write("foo\r\n1.5,2.5,1\r\n3.5,4.5,2\r\n")
+
+        try:
+            data: dict[str, Ring] = Reader.read(crlf_filename)
+            assert [(p.x, p.y, p.ID) for p in data["foo"]] == [
+                (1.5, 2.5, 1),
+                (3.5, 4.5, 2),
+            ]
+        finally:
+            os.remove(crlf_filename)
+
+    def test_reader_read_non_ascii_names(self):
+        """Test that ring names outside ASCII survive a write-read round trip, as
+        they did with the baseline text-mode I/O."""
+
+        name_filename = pathlib.Path("test/unit-tests/fileIO/test_names.txt")
+        out_filename = pathlib.Path("test/unit-tests/fileIO/test_names_out.txt")
+        with open(name_filename, "w", encoding="utf-8") as fd:
+            fd.write("ränd\n0.0,0.0,0\n1.5,0.0,1\n")
+
+        try:
+            data: dict[str, Ring] = Reader.read(name_filename)
+            assert list(data.keys()) == ["ränd"]
+            assert len(data["ränd"]) == 2
+
+            Writer.write(out_filename, data)
+            with open(name_filename, "rb") as f_in:
+                with open(out_filename, "rb") as f_out:
+                    assert f_out.read() == f_in.read()
+        finally:
+            for filename in (name_filename, out_filename):
+                if os.path.exists(filename):
+                    os.remove(filename)
+
+    def test_reader_read_duplicate_names(self):
+        """Test that a repeated ring name keeps only the last block under that
+        name."""
+
+        duplicate_filename = pathlib.Path("test/unit-tests/fileIO/test_dupes.txt")
+        with open(duplicate_filename, "w") as fd:
+            fd.write("foo\n1,1,1\nfoo\n2,2,2\n3,3,3\n")
+
+        try:
+            data: dict[str, Ring] = Reader.read(duplicate_filename)
+            assert len(data) == 1
+            assert len(data["foo"]) == 2
+            assert Point(x=2, y=2, ID=2) in data["foo"]
+            assert Point(x=3, y=3, ID=3) in data["foo"]
+            assert Point(x=1, y=1, ID=1) not in data["foo"]
+        finally:
+            os.remove(duplicate_filename)
+
     def test_reader_read(self):
         """Test reading sample data from a geometry file."""
 
@@ -28,10 +28,25 @@ def test_point_init(sample_data, sample_points):
     """This tests point construction and point attributes."""
 
     for p, point in enumerate(sample_points):
-        for key, val in sample_data.items():
-            assert hasattr(point, f"_{key}")
-            assert getattr(point, f"_{key}") == val[p]
-            assert getattr(point, f"{key}") == val[p]
+        assert point.ID == sample_data["ID"][p]
+        assert point.x == sample_data["x"][p]
+        assert point.y == sample_data["y"][p]
+
+        # The old private names are kept as read-only aliases.
+        assert point._ID == sample_data["ID"][p]
+        assert point._x == sample_data["x"][p]
+        assert point._y == sample_data["y"][p]
+
+
+def test_point_immutable(sample_points):
+    """This tests that point attributes cannot be rebound after construction."""
+
+    for point in sample_points:
+        for attr in ("ID", "x", "y"):
+            with pytest.raises(AttributeError) as exc:
+                setattr(point, attr, 0)
+
+            assert exc.value.args[0] == f"Point.{attr} is read-only!"
 
 
 @pytest.mark.parametrize(
@@ -1,12 +1,16 @@
+import copy
+
+import numpy as np
 import pytest
 
 from mesher.geometry.point import Point
-from mesher.geometry.ring import Node, Ring
+from mesher.geometry.ring import Node, Ring, find_duplicate_rings
 
 
-@pytest.fixture
-def sample_points() -> dict[str, list[Point]]:
-    """Generates sample points from a number of scenarios for testing."""
+@pytest.fixture(scope="session")
+def _sample_points_master() -> dict[str, list[Point]]:
+    """Builds the sample-point scenarios once per session; tests get per-test deep
+    copies through `sample_points` since several tests mutate the lists in place."""
 
     # TODO: handle self-intersecting rings
 
@@ -47,6 +51,15 @@ def sample_points() -> dict[str, list[Point]]:
     }
 
 
+@pytest.fixture
+def sample_points(
+    _sample_points_master: dict[str, list[Point]],
+) -> dict[str, list[Point]]:
+    """Generates sample points from a number of scenarios for testing."""
+
+    return copy.deepcopy(_sample_points_master)
+
+
 @pytest.fixture
 def sample_rings(sample_points: dict[str, list[Point]]) -> dict[str, Ring]:
     """Generates sample rings for testing."""
@@ -399,6 +412,28 @@ def test_ring_find_point(sample_rings, scenario, point, loc):
         assert sample_rings[scenario].find_point(point) is None
 
 
+def test_ring_find_self_intersections(sample_rings):
+    """This tests finding the self-intersections of a ring."""
+
+    for scenario, ring in sample_rings.items():
+        if "closed" in scenario:
+            assert ring.find_self_intersections() == []
+
+    bowtie: Ring = Ring()
+    bowtie.add_point(Point(x=0, y=0, ID=0))
+    bowtie.add_point(Point(x=1, y=1, ID=1))
+    bowtie.add_point(Point(x=1, y=0, ID=2))
+    bowtie.add_point(Point(x=0, y=1, ID=3))
+    bowtie.close()
+
+    intersections = bowtie.find_self_intersections()
+    assert len(intersections) == 1
+    assert intersections[0][0] == 0
+    assert intersections[0][1] == 2
+    assert intersections[0][2] == Point(x=0.5, y=0.5, ID=-1)
+    assert intersections[0][2].ID == -1
+
+
 def test_ring_insert_point_open(sample_rings, sample_points):
     """This tests inserting a new point in an open ring."""
 
@@ -496,3 +531,100 @@ def test_ring_reverse_orientation(
 
         assert node.left.value.ID == sample_points[scenario][n_before].ID
         assert node.right.value.ID == sample_points[scenario][n_after].ID
+
+
+@pytest.mark.parametrize(
+    "scenario,orient",
+    [
+        ("closed,CCW,convex", "CCW"),
+        ("closed,CW,convex", "CW"),
+    ],
+)
+def test_ring_force_orientation(sample_rings, scenario, orient):
+    """This tests forcing a ring into a given orientation."""
+
+    ring: Ring = sample_rings[scenario]
+    assert ring.orientation == orient
+
+    nodes = list(ring._nodes)
+    ring.force_ccw()
+    assert ring.orientation == "CCW"
+    if orient == "CCW":
+        assert ring._nodes == nodes
+
+    ring.force_cw()
+    assert ring.orientation == "CW"
+
+
+def test_ring_contains_points():
+    """This tests the vectorized batch point-in-ring check."""
+
+    ring: Ring = Ring()
+    ring.add_point(Point(x=0, y=0, ID=0))
+    ring.add_point(Point(x=2, y=0, ID=1))
+    ring.add_point(Point(x=2, y=2, ID=2))
+    ring.add_point(Point(x=0, y=2, ID=3))
+
+    assert not ring.contains_points(np.array([1.0]), np.array([1.0])).any()
+
+    ring.close()
+    mask = ring.contains_points(
+        np.array([1.0, 3.0, -1.0]), np.array([1.0, 1.0, 1.0])
+    )
+    assert mask.tolist() == [True, False, False]
+
+
+def test_ring_fingerprint():
+    """This tests that the rotation-invariant fingerprint matches for rings tracing
+    the same polygon from different starting points and differs for distinct rings."""
+
+    points: list[Point] = [
+        Point(x=0, y=0, ID=0),
+        Point(x=2, y=0, ID=1),
+        Point(x=2, y=2, ID=2),
+        Point(x=0, y=2, ID=3),
+    ]
+
+    ring1: Ring = Ring()
+    for point in points:
+        ring1.add_point(point)
+
+    ring2: Ring = Ring()
+    for point in points[2:] + points[:2]:
+        ring2.add_point(point)
+
+    assert ring1.fingerprint() == ring2.fingerprint()
+
+    ring3: Ring = Ring()
+    for point in points[:-1]:
+        ring3.add_point(point)
+
+    assert ring1.fingerprint() != ring3.fingerprint()
+
+
+def test_ring_find_duplicates_parallel():
+    """This tests that parallel duplicate detection matches the serial mask on a
+    fixture with several duplicate buckets."""
+
+    def build_ring(coords: list[tuple[float, float]], start: int) -> Ring:
+        ring: Ring = Ring()
+        for n, (x, y) in enumerate(coords[start:] + coords[:start]):
+            ring.add_point(Point(x=x, y=y, ID=n))
+
+        ring.close()
+        return ring
+
+    square: list[tuple[float, float]] = [(0, 0), (2, 0), (2, 2), (0, 2)]
+    shifted: list[tuple[float, float]] = [(5, 0), (7, 0), (7, 2), (5, 2)]
+    triangle: list[tuple[float, float]] = [(0, 0), (1, 0), (0, 1)]
+    rings: list[Ring] = [
+        build_ring(square, 0),
+        build_ring(shifted, 0),
+        build_ring(square, 2),
+        build_ring(triangle, 0),
+        build_ring(shifted, 1),
+    ]
+
+    serial: list[bool] = find_duplicate_rings(rings)
+    assert serial == [False, False, True, False, True]
+    assert find_duplicate_rings(rings, parallel=True) == serial